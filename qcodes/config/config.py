@@ -415,20 +415,26 @@ class DotDict(dict):
     def __getitem__(self, key):
         if type(key) != str or '.' not in key:
             return dict.__getitem__(self, key)
-        myKey, restOfKey = key.split('.', 1)
-        target = dict.__getitem__(self, myKey)
-        return target[restOfKey]
+        # Walk down nested DotDicts in a loop rather than recursing through
+        # __getitem__ for each level of a dotted key
+        target = self
+        while True:
+            myKey, key = key.split('.', 1)
+            target = dict.__getitem__(target, myKey)
+            if '.' not in key or type(target) is not DotDict:
+                return target[key]
 
     def __contains__(self, key):
         if not isinstance(key, str) or '.' not in key:
             return dict.__contains__(self, key)
-        myKey, restOfKey = key.split('.', 1)
-
-        if myKey not in self:
-            return False
-        else:
-            target = dict.__getitem__(self, myKey)
-            return restOfKey in target
+        target = self
+        while True:
+            myKey, key = key.split('.', 1)
+            if not dict.__contains__(target, myKey):
+                return False
+            target = dict.__getitem__(target, myKey)
+            if '.' not in key or type(target) is not DotDict:
+                return key in target
 
     def __deepcopy__(self, memo):
         return DotDict(copy.deepcopy(dict(self)))
@@ -3,6 +3,7 @@ import re
 import math
 import json
 import logging
+from itertools import chain
 
 from qcodes.utils.helpers import deep_update, NumpyJSONEncoder
 from .data_array import DataArray
@@ -223,7 +224,7 @@ class GNUPlotFormat(Formatter):
         # Using mark_saved is better than directly setting last_saved_index
         # because it also ensures modified_range is set correctly.
         indices[-1] -= 1
-        for array in set_arrays + tuple(data_arrays):
+        for array in chain(set_arrays, data_arrays):
             array.mark_saved(array.flat_index(indices[:array.ndim]))
 
     def _is_comment(self, line):
@@ -46,6 +46,7 @@ import os
 import re
 import shutil
 from fnmatch import fnmatch
+from itertools import chain
 
 ALLOWED_OPEN_MODES = ('r', 'w', 'a')
 
@@ -202,7 +203,8 @@ class DiskIO:
                         if depth == maxdepth:
                             dirs[:] = []  # don't recurse any further
 
-                        for fn in files + (dirs if include_dirs else []):
+                        for fn in (chain(files, dirs) if include_dirs
+                                   else files):
                             out.append(self.to_location(self.join(root, fn)))
 
                 elif include_dirs:
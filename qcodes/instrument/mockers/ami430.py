@@ -1,6 +1,25 @@
 import re
 import time
 from datetime import datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _message_regex(gs, key):
+    """
+    Compile the regular expression matching get or set messages for a
+    handler key. There are only a few keys, so each pattern is compiled once.
+    """
+    # We need to replace reserved regular expression characters in the
+    # key. For instance replace "*IDN" with "\*IDN".
+    reserved_re_characters = "\^${}[]().*+?|<>-&"
+    for c in reserved_re_characters:
+        key = key.replace(c, "\{}".format(c))
+
+    # Get and set messages use different regular expression
+    s = {"get": "(:[^:]*)?\?$", "set": "([^:]+)"}[gs]
+    # patterns to determine a match
+    return re.compile("^" + key + s)
 
 
 class MockAMI430:
@@ -135,18 +154,8 @@ class MockAMI430:
             return True, None
 
         # We use regular expressions to find out if the message string
-        # and the key match. We need to replace reserved regular
-        # expression characters in the key. For instance replace
-        # "*IDN" with "\*IDN".
-        reserved_re_characters = "\^${}[]().*+?|<>-&"
-        for c in reserved_re_characters:
-            key = key.replace(c, "\{}".format(c))
-
-        # Get and set messages use different regular expression
-        s = {"get": "(:[^:]*)?\?$", "set": "([^:]+)"}[gs]
-        # patterns to determine a match
-        search_string = "^" + key + s
-        r = re.search(search_string, msg_str)
+        # and the key match.
+        r = _message_regex(gs, key).search(msg_str)
         match = r is not None
 
         args = None
@@ -82,6 +82,9 @@ from qcodes.data.data_array import DataArray
 if TYPE_CHECKING:
     from .base import Instrument
 
+# Sentinel for dict lookups where None is a valid value
+_MISSING = object()
+
 
 def __deepcopy__(self, memodict={}):
     """_BaseParameter.__deepcopy__ method, Invoked via copy.deepcopy(param).
@@ -621,8 +624,9 @@ class _BaseParameter(Metadatable, SignalEmitter):
                         value /= self.scale
 
                 if self.val_mapping is not None:
-                    if value in self.inverse_val_mapping:
-                        value = self.inverse_val_mapping[value]
+                    mapped_value = self.inverse_val_mapping.get(value, _MISSING)
+                    if mapped_value is not _MISSING:
+                        value = mapped_value
                     else:
                         try:
                             value = self.inverse_val_mapping[int(value)]
@@ -804,8 +808,12 @@ class _BaseParameter(Metadatable, SignalEmitter):
                         self.name, start_value, value))
                 return []
 
-            # drop the initial value, we're already there
-            return permissive_range(start_value, value, step)[1:] + [value]
+            # drop the initial value, we're already there, and end on the
+            # target value. Done in place to avoid copying long ramps
+            ramp_values = permissive_range(start_value, value, step)
+            del ramp_values[:1]
+            ramp_values.append(value)
+            return ramp_values
 
     def validate(self, value):
         """
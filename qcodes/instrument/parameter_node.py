@@ -206,16 +206,21 @@ class ParameterNode(Metadatable, DelegateAttributes, metaclass=ParameterNodeMeta
     def __getattr__(self, attr):
         if attr == 'use_as_attributes':
             return super().__getattr__(attr)
-        elif attr in self.parameters:
-            parameter = self.parameters[attr]
+
+        # Attribute names never contain dots, so the plain dict lookup gives
+        # the same result while skipping the DotDict key handling
+        parameter = dict.get(self.parameters, attr)
+        if parameter is not None:
             if self.use_as_attributes:
                 # Perform get and return value
                 return parameter()
             else:
                 # Return parameter instance
                 return parameter
-        elif attr in self.parameter_nodes:
-            return self.parameter_nodes[attr]
+
+        parameter_node = dict.get(self.parameter_nodes, attr)
+        if parameter_node is not None:
+            return parameter_node
         else:
             return super().__getattr__(attr)
 
@@ -265,11 +270,14 @@ class ParameterNode(Metadatable, DelegateAttributes, metaclass=ParameterNodeMeta
                 # Update nested ParameterNode name
                 val.name = attr
             val.log_changes = self.log_changes
-        elif attr in self.parameters:
-            # Set parameter value
-            self.parameters[attr](val)
         else:
-            super().__setattr__(attr, val)
+            # Single plain dict lookup, see __getattr__
+            parameter = dict.get(self.parameters, attr)
+            if parameter is not None:
+                # Set parameter value
+                parameter(val)
+            else:
+                super().__setattr__(attr, val)
 
     def __copy__(self):
         """Copy method for ParameterNode, invoked by copy.copy(parameter_node).
@@ -49,6 +49,9 @@ class SweepValues(Metadatable):
     That allows things like adaptive sampling, where you don't know ahead of
     time what the values will be or even how many there are.
     """
+    # Metadatable provides __dict__, so subclasses can still add attributes
+    __slots__ = ('parameter', 'name', '_values', 'set')
+
     def __init__(self, parameter, **kwargs):
         super().__init__(**kwargs)
         self.parameter = parameter
@@ -127,6 +130,8 @@ class SweepFixedValues(SweepValues):
     That allows things like adaptive sampling, where you don't know ahead of
     time what the values will be or even how many there are.
     """
+    __slots__ = ('_snapshot', '_value_snapshot')
+
     def __init__(self, parameter, keys=None, start=None, stop=None,
                  step=None, num=None):
         super().__init__(parameter)
@@ -1,8 +1,7 @@
 import numpy as np
 from typing import List, Tuple, Union, Sequence, Dict, Any, Callable, Iterable
 import threading
-from time import sleep, perf_counter
-import traceback
+from time import perf_counter
 import logging
 from datetime import datetime
 
@@ -21,6 +20,12 @@ from qcodes.utils.helpers import (
 from qcodes import config as qcodes_config
 
 RAW_VALUE_TYPES = (float, int, bool, np.ndarray, np.integer, np.floating, np.bool_, type(None))
+# Exact types of the most common raw values, allowing a fast set lookup
+# before falling back to isinstance checks against RAW_VALUE_TYPES
+RAW_VALUE_TYPES_SET = frozenset({
+    float, int, bool, np.ndarray, np.float64, np.float32, np.int64, np.int32,
+    np.bool_, type(None)
+})
 
 class Measurement:
     """Class to perform measurements
@@ -45,6 +50,32 @@ class Measurement:
 
     """
 
+    # Frequently accessed instance attributes are stored in slots.
+    # __dict__ is kept since the instance final_actions and except_actions
+    # shadow the global class-level lists of the same name.
+    __slots__ = (
+        "name",
+        "dataset",
+        "loop_shape",
+        "loop_indices",
+        "action_indices",
+        "_data_groups",
+        "actions",
+        "action_names",
+        "is_context_manager",
+        "is_stopped",
+        "_run_event",
+        "notify",
+        "force_cell_thread",
+        "_masked_properties",
+        "timings",
+        "data_arrays",
+        "set_arrays",
+        "_t_start",
+        "_t_start_perf",
+        "__dict__",
+    )
+
     # Context manager
     running_measurement = None
     measurement_thread = None
@@ -57,8 +88,6 @@ class Measurement:
     except_actions = []
     max_arrays = 100
 
-    _t_start = None
-
     # Notification function, called if notify=True.
     # Function should receive the following arguments:
     # Measurement object, exception_type, exception_message, traceback
@@ -88,9 +117,12 @@ class Measurement:
         self.action_names: Dict[Tuple[int], str] = {}
 
         self.is_context_manager: bool = False  # Whether used as context manager
-        self.is_paused: bool = False  # Whether the Measurement is paused
         self.is_stopped: bool = False  # Whether the Measurement is stopped
 
+        # Cleared while the Measurement is paused
+        self._run_event = threading.Event()
+        self._run_event.set()
+
         self.notify = notify
 
         self.force_cell_thread = force_cell_thread and using_ipython()
@@ -105,6 +137,10 @@ class Measurement:
 
         self.timings = PerformanceTimer()
 
+        # Reference start times, set when the dataset metadata is initialized
+        self._t_start = None
+        self._t_start_perf = None
+
     def log(self, message: str, level="info"):
         """Send a log message
 
@@ -129,6 +165,11 @@ class Measurement:
         else:
             return self._data_groups
 
+    @property
+    def is_paused(self) -> bool:
+        """Whether the Measurement is paused"""
+        return not self._run_event.is_set()
+
     @property
     def active_action(self):
         return self.actions.get(self.action_indices, None)
@@ -300,6 +341,10 @@ class Measurement:
         if Station.default is not None:
             dataset.add_metadata({"station": Station.default.snapshot()})
 
+        # Reference times for timestamped measurements
+        self._t_start = datetime.now()
+        self._t_start_perf = perf_counter()
+
         if using_ipython():
             measurement_cell = get_last_input_cells(1)[0]
 
@@ -310,7 +355,6 @@ class Measurement:
             if measurement_code.startswith(init_string):
                 measurement_code = measurement_code[len(init_string) + 1 : -4]
 
-            self._t_start = datetime.now()
             dataset.add_metadata(
                 {
                     "measurement_cell": measurement_cell,
@@ -608,6 +652,8 @@ class Measurement:
             try:
                 action()
             except Exception as e:
+                import traceback
+
                 self.log(
                     f"Could not execute {label} action {action} \n"
                     f"{traceback.format_exc()}",
@@ -770,6 +816,19 @@ class Measurement:
         )
         return result
 
+    def _store_scalar(self, name: str, value: float, unit: str = None):
+        """Store a raw scalar value and increment the action index.
+
+        Lightweight alternative to ``measure`` for internally generated values
+        such as timestamps, skipping the measurable type dispatch, pause check
+        and timing records.
+        """
+        self._verify_action(action=None, name=name, add_if_new=True)
+        self._add_measurement_result(
+            action_indices=self.action_indices, result=value, name=name, unit=unit
+        )
+        self.skip()  # Increment last action index by 1
+
     def measure(
         self,
         measurable: Union[
@@ -823,31 +882,31 @@ class Measurement:
             # DataGroup in the running measurement. Delegate measurement to the
             # running measurement
             return Measurement.running_measurement.measure(
-                measurable, name=name, label=label, unit=unit, **kwargs
+                measurable, name=name, label=label, unit=unit,
+                timestamp=timestamp, **kwargs
             )
 
         # Code from hereon is only reached by the primary measurement,
         # i.e. the running_measurement
 
         # Wait as long as the measurement is paused
-        while self.is_paused:
-            sleep(0.1)
+        self._wait_while_paused()
+        if self.is_stopped:
+            raise SystemExit("Measurement.stop() has been called")
 
         t0 = perf_counter()
         initial_action_indices = self.action_indices
 
         if timestamp:
-            t_now = datetime.now()
-
             # Store time referenced to t_start
-            self.measure((t_now - self._t_start).total_seconds(),
-                         'T_pre', unit='s', timestamp=False)
-            self.skip()  # Increment last action index by 1
-
-
+            self._store_scalar('T_pre', perf_counter() - self._t_start_perf, unit='s')
+            self.skip()  # Leave a gap after timestamps, as in earlier datasets
 
         # TODO Incorporate kwargs name, label, and unit, into each of these
-        if isinstance(measurable, Parameter):
+        if type(measurable) in RAW_VALUE_TYPES_SET:
+            result = self._measure_value(measurable, name=name, label=label, unit=unit, **kwargs)
+            self.skip()  # Increment last action index by 1
+        elif isinstance(measurable, Parameter):
             result = self._measure_parameter(
                 measurable, name=name, label=label, unit=unit, **kwargs
             )
@@ -868,13 +927,9 @@ class Measurement:
             )
 
         if timestamp:
-            t_now = datetime.now()
-
             # Store time referenced to t_start
-            self.measure((t_now - self._t_start).total_seconds(),
-                         'T_post', unit='s', timestamp=False)
-            self.skip()  # Increment last action index by 1
-
+            self._store_scalar('T_post', perf_counter() - self._t_start_perf, unit='s')
+            self.skip()  # Leave a gap after timestamps, as in earlier datasets
 
         self.timings.record(
             ['measurement', initial_action_indices, 'total'],
@@ -1064,6 +1119,8 @@ class Measurement:
                 else:
                     raise SyntaxError(f"Unmask type {type} not understood")
             except Exception as e:
+                import traceback
+
                 self.log(
                     f"Could not unmask {obj} {type} from masked value {value} "
                     f"to original value {original_value}\n"
@@ -1084,11 +1141,11 @@ class Measurement:
     # Functions relating to measurement flow
     def pause(self):
         """Pause measurement at start of next parameter sweep/measurement"""
-        running_measurement().is_paused = True
+        running_measurement()._run_event.clear()
 
     def resume(self):
         """Resume measurement after being paused"""
-        running_measurement().is_paused = False
+        running_measurement()._run_event.set()
 
     def stop(self):
         """Stop measurement at start of next parameter sweep/measurement"""
@@ -1096,6 +1153,16 @@ class Measurement:
         # Unpause loop
         running_measurement().resume()
 
+    def _wait_while_paused(self, poll_interval: float = 0.1):
+        """Block until the measurement is no longer paused.
+
+        Waits in short intervals instead of a single blocking wait, so that
+        asynchronous exceptions such as those from ``job.terminate()`` can
+        still interrupt a paused measurement.
+        """
+        while not self._run_event.wait(poll_interval):
+            pass
+
     def skip(self, N=1):
         """Skip an action index.
 
@@ -1125,9 +1192,8 @@ class Measurement:
         if running_measurement() is not self:
             return running_measurement().skip(N=N)
         else:
-            action_indices = list(self.action_indices)
-            action_indices[-1] += N
-            self.action_indices = tuple(action_indices)
+            action_indices = self.action_indices
+            self.action_indices = action_indices[:-1] + (action_indices[-1] + N,)
             return self.action_indices
 
     def revert(self, N=1):
@@ -1138,9 +1204,8 @@ class Measurement:
         if running_measurement() is not self:
             return running_measurement().revert(N=N)
         else:
-            action_indices = list(self.action_indices)
-            action_indices[-1] -= N
-            self.action_indices = tuple(action_indices)
+            action_indices = self.action_indices
+            self.action_indices = action_indices[:-1] + (action_indices[-1] - N,)
             return self.action_indices
 
     def step_out(self, reduce_dimension=True):
@@ -1156,9 +1221,8 @@ class Measurement:
                 self.loop_indices = self.loop_indices[:-1]
 
             # Remove last action index and increment one before that by one
-            action_indices = list(self.action_indices[:-1])
-            action_indices[-1] += 1
-            self.action_indices = tuple(action_indices)
+            action_indices = self.action_indices
+            self.action_indices = action_indices[:-2] + (action_indices[-2] + 1,)
 
     def traceback(self):
         """Print traceback if an error occurred.
@@ -1199,6 +1263,20 @@ class Sweep:
             for param_val in Sweep(p.
         ```
     """
+    __slots__ = (
+        "name",
+        "unit",
+        "sequence",
+        "dimension",
+        "loop_index",
+        "iterator",
+        "reverse",
+        "restore",
+        "set_array",
+        "_set_sweep_value",
+        "_loop_step",
+    )
+
     def __init__(self, sequence, name=None, unit=None, reverse=False, restore=False):
         if running_measurement() is None:
             raise RuntimeError("Cannot create a sweep outside a Measurement")
@@ -1217,6 +1295,10 @@ class Sweep:
         self.reverse = reverse
         self.restore = restore
 
+        # Per-iteration behaviour, fixed when the sweep starts iterating
+        self._set_sweep_value = None
+        self._loop_step = 1
+
         msmt = running_measurement()
         if msmt.action_indices in msmt.set_arrays:
             self.set_array = msmt.set_arrays[msmt.action_indices]
@@ -1237,9 +1319,17 @@ class Sweep:
         if self.reverse:
             self.loop_index = len(self.sequence) - 1
             self.iterator = iter(self.sequence[::-1])
+            self._loop_step = -1
         else:
             self.loop_index = 0
             self.iterator = iter(self.sequence)
+            self._loop_step = 1
+
+        # Resolve how sweep values are applied once instead of every iteration
+        if isinstance(self.sequence, SweepValues):
+            self._set_sweep_value = self.sequence.set
+        else:
+            self._set_sweep_value = None
 
         running_measurement().loop_shape += (len(self.sequence),)
         running_measurement().loop_indices += (self.loop_index,)
@@ -1256,24 +1346,23 @@ class Sweep:
                 "Must use the Measurement as a context manager, "
                 "i.e. 'with Measurement(name) as msmt:'"
             )
-        elif msmt.is_stopped:
-            raise SystemExit
 
         # Wait as long as the measurement is paused
-        while msmt.is_paused:
-            sleep(0.1)
+        msmt._wait_while_paused()
+        if msmt.is_stopped:
+            raise SystemExit
 
         # Increment loop index of current dimension
-        loop_indices = list(msmt.loop_indices)
-        loop_indices[self.dimension] = self.loop_index
-        msmt.loop_indices = tuple(loop_indices)
+        loop_indices = msmt.loop_indices
+        dimension = self.dimension
+        msmt.loop_indices = (
+            loop_indices[:dimension] + (self.loop_index,) + loop_indices[dimension + 1:]
+        )
 
         try:  # Perform loop action
             sweep_value = next(self.iterator)
-            # Remove last action index and increment one before that by one
-            action_indices = list(msmt.action_indices)
-            action_indices[-1] = 0
-            msmt.action_indices = tuple(action_indices)
+            # Reset the action index of the current sweep dimension
+            msmt.action_indices = msmt.action_indices[:-1] + (0,)
         except StopIteration:  # Reached end of iteration
             if self.restore:
                 if isinstance(self.sequence, SweepValues):
@@ -1283,12 +1372,12 @@ class Sweep:
                     pass
             self.exit_sweep()
 
-        if isinstance(self.sequence, SweepValues):
-            self.sequence.set(sweep_value)
+        if self._set_sweep_value is not None:
+            self._set_sweep_value(sweep_value)
 
         self.set_array[msmt.loop_indices] = sweep_value
 
-        self.loop_index += 1 if not self.reverse else -1
+        self.loop_index += self._loop_step
 
         return sweep_value
 
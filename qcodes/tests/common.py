@@ -1,3 +1,6 @@
+import logging
+
+
 def strip_qc(d, keys=('instrument', '__class__')):
     # depending on how you run the tests, __module__ can either
     # have qcodes on the front or not. Just strip it off.
@@ -5,3 +8,13 @@ def strip_qc(d, keys=('instrument', '__class__')):
         if key in d:
             d[key] = d[key].replace('qcodes.tests.', 'tests.')
     return d
+
+
+class ListHandler(logging.Handler):
+    """Collect emitted log records in a list, for inspection by tests."""
+    def __init__(self):
+        super().__init__(level=logging.DEBUG)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
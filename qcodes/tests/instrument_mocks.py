@@ -5,6 +5,13 @@ from qcodes.utils.validators import Numbers
 from qcodes.instrument.parameter import MultiParameter, Parameter, ArrayParameter
 from qcodes.instrument.channel import InstrumentChannel, ChannelList
 
+# Validators are stateless, so a single instance is shared between all
+# parameters of the mock instruments that need it
+_NUMBERS_ANY = Numbers()
+_NUMBERS_GATE = Numbers(-800, 400)
+_NUMBERS_TEMPERATURE = Numbers(0, 300)
+
+
 class MockParabola(Instrument):
     '''
     Holds dummy parameters which are get and set able as well as provides
@@ -26,13 +33,13 @@ class MockParabola(Instrument):
         for parname in ['x', 'y', 'z']:
             self.add_parameter(parname, unit='a.u.',
                                parameter_class=Parameter,
-                               vals=Numbers(), initial_value=0,
+                               vals=_NUMBERS_ANY, initial_value=0,
                                get_cmd=None, set_cmd=None)
 
         self.add_parameter('noise', unit='a.u.',
                            label='white noise amplitude',
                            parameter_class=Parameter,
-                           vals=Numbers(), initial_value=0,
+                           vals=_NUMBERS_ANY, initial_value=0,
                            get_cmd=None, set_cmd=None)
 
         self.add_parameter('parabola', unit='a.u.',
@@ -68,7 +75,7 @@ class MockMetaParabola(Instrument):
         for parname in ['x', 'y', 'z']:
             self.add_parameter(parname, unit='a.u.',
                                parameter_class=Parameter,
-                               vals=Numbers(), initial_value=0,
+                               vals=_NUMBERS_ANY, initial_value=0,
                                get_cmd=None, set_cmd=None)
         self.add_parameter('gain', parameter_class=Parameter,
                            initial_value=1,
@@ -109,7 +116,7 @@ class DummyInstrument(Instrument):
                                initial_value=0,
                                label='Gate {}'.format(g),
                                unit="V",
-                               vals=Numbers(-800, 400),
+                               vals=_NUMBERS_GATE,
                                get_cmd=None, set_cmd=None)
 
 class DummyChannel(InstrumentChannel):
@@ -128,7 +135,7 @@ class DummyChannel(InstrumentChannel):
                            initial_value=0,
                            label="Temperature_{}".format(channel),
                            unit='K',
-                           vals=Numbers(0, 300),
+                           vals=_NUMBERS_TEMPERATURE,
                            get_cmd=None, set_cmd=None)
 
         self.add_parameter(name='dummy_multi_parameter',
@@ -87,6 +87,27 @@ class TestCommand(TestCase):
                       input_parser=swap, output_parser=upper)
         self.assertEqual(cmd('I', 'you'), 'YOU AND I NOW')
 
+    def test_cmd_str_single_field(self):
+        def echo(s):
+            return s
+
+        # single plain fields are filled in without format parsing, fields
+        # with a format spec or conversion still use str.format
+        for cmd_str, arg, expected, affixes in [
+                ('VOLT {}', 1.5, 'VOLT 1.5', True),
+                ('{0};', 'x', 'x;', True),
+                ('{{{}}} {{', 3, '{3} {', True),
+                ('{:.2f} V', 1, '1.00 V', False),
+                ('{!r}', 'x', "'x'", False)]:
+            with self.subTest(cmd_str=cmd_str):
+                cmd = Command(1, cmd_str, exec_str=echo)
+                if affixes:
+                    self.assertEqual(cmd.exec_function, cmd.call_by_str_affixes)
+                else:
+                    self.assertEqual(cmd.exec_function, cmd.call_by_str)
+                self.assertEqual(cmd(arg), expected)
+                self.assertEqual(cmd(arg), cmd_str.format(arg))
+
     def test_cmd_function(self):
         def myexp(a, b):
             return a ** b
@@ -5,6 +5,7 @@ from functools import partial
 from unittest.mock import mock_open, patch, PropertyMock
 from unittest import TestCase
 from qcodes.config import Config
+from qcodes.config.config import DotDict
 
 VALID_JSON = "{}"
 ENV_KEY = "/dev/random"
@@ -220,3 +221,33 @@ class TestConfig(TestCase):
         self.conf.add("foo", "bar", "string", "foo", "bar")
         self.assertEqual(self.conf.current_config, UPDATED_CONFIG)
         self.assertEqual(self.conf.current_schema, UPDATED_SCHEMA)
+
+
+class TestDotDict(TestCase):
+    def setUp(self):
+        self.d = DotDict({'a': {'b': {'c': 1}}, 'x': 1})
+        # Plain dicts are normally converted, so bypass DotDict.__setitem__
+        dict.__setitem__(self.d, 'plain', {'q.r': 5})
+
+    def test_get_nested_key(self):
+        self.assertEqual(self.d['a.b.c'], 1)
+        self.assertEqual(self.d['a.b'], {'c': 1})
+        self.assertEqual(self.d['x'], 1)
+
+    def test_get_through_plain_dict(self):
+        # The rest of the key is passed on unsplit to a plain dict
+        self.assertEqual(self.d['plain.q.r'], 5)
+
+    def test_get_missing_key(self):
+        for key in ['a.b.z', 'a.z.c', 'z.b', 'z']:
+            with self.subTest(key=key):
+                with self.assertRaises(KeyError):
+                    self.d[key]
+
+    def test_contains(self):
+        for key in ['a', 'a.b', 'a.b.c', 'x', 'plain.q.r']:
+            with self.subTest(key=key):
+                self.assertIn(key, self.d)
+        for key in ['a.b.z', 'a.z.c', 'z.b', 'z', 'plain.q']:
+            with self.subTest(key=key):
+                self.assertNotIn(key, self.d)
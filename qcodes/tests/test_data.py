@@ -7,13 +7,12 @@ import logging
 from qcodes.data.data_array import DataArray
 from qcodes.data.io import DiskIO
 from qcodes.data.data_set import load_data, new_data, DataSet
-from qcodes.utils.helpers import LogCapture
 
 from .data_mocks import (MockFormatter, MatchIO,
                          DataSet2D, DataSet1D,
                          DataSetCombined, RecordingMockFormatter)
 
-from .common import strip_qc
+from .common import strip_qc, ListHandler
 
 
 class TestDataArray(TestCase):
@@ -521,12 +520,21 @@ class TestDataSet(TestCase):
         bf['fail'] = self.failing_func
         bf['log'] = self.logging_func
 
-        with LogCapture() as logs:
+        logger = logging.getLogger()
+        handler = ListHandler()
+        level = logger.level
+        logger.addHandler(handler)
+        try:
             # grab info and warnings but not debug messages
-            logging.getLogger().setLevel(logging.INFO)
+            logger.setLevel(logging.INFO)
             data.complete(delay=0.001)
+        finally:
+            logger.removeHandler(handler)
+            logger.setLevel(level)
 
-        logs = logs.value
+        # tracebacks are logged as a single record ending in the error line
+        messages = [record.getMessage().rstrip()
+                    for record in handler.records]
 
         expected_logs = [
             'waiting for DataSet <False> to complete',
@@ -546,14 +554,6 @@ class TestDataSet(TestCase):
             'DataSet <False> is complete'
         ]
 
-        log_index = 0
-        for line in expected_logs:
-            self.assertIn(line, logs, logs)
-            try:
-                log_index_new = logs.index(line, log_index)
-            except ValueError:
-                raise ValueError('line {} not found after {} in: \n {}'.format(
-                    line, log_index, logs))
-            self.assertTrue(log_index_new >= log_index, logs)
-            log_index = log_index_new + len(line) + 1  # +1 for \n
-        self.assertEqual(log_index, len(logs), logs)
+        self.assertEqual(len(messages), len(expected_logs), messages)
+        for message, line in zip(messages, expected_logs):
+            self.assertTrue(message.endswith(line), messages)
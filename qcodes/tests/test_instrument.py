@@ -5,23 +5,48 @@ from unittest import TestCase
 from qcodes.instrument.base import Instrument
 from .instrument_mocks import DummyInstrument, MockParabola
 from qcodes.instrument.parameter import Parameter
-import gc
 
 
 class TestInstrument(TestCase):
+    gates = ['dac1', 'dac2', 'dac3']
+    _instrument2 = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.instrument = DummyInstrument(name='testdummy', gates=cls.gates)
+
+    @classmethod
+    def tearDownClass(cls):
+        # Closing removes the instruments from the instrument registry, so
+        # no global garbage collection is needed
+        cls.instrument.close()
+        del cls.instrument
+        if cls._instrument2 is not None:
+            cls._instrument2.close()
+            cls._instrument2 = None
+
+    @property
+    def instrument2(self):
+        # Few tests need a second instrument, so only create it on first use
+        cls = type(self)
+        if cls._instrument2 is None:
+            cls._instrument2 = MockParabola("parabola")
+        return cls._instrument2
 
     def setUp(self):
-        self.instrument = DummyInstrument(
-            name='testdummy', gates=['dac1', 'dac2', 'dac3'])
-        self.instrument2 = MockParabola("parabola")
+        # Reset gate values, which tests may modify
+        for gate in self.gates:
+            self.instrument.parameters[gate](0)
+
+        self.parameter_names = set(self.instrument.parameters)
+        self.function_names = set(self.instrument.functions)
 
     def tearDown(self):
-        # force gc run
-        self.instrument.close()
-        self.instrument2.close()
-        del self.instrument
-        del self.instrument2
-        gc.collect()
+        # Remove parameters and functions added during the test
+        for name in set(self.instrument.parameters) - self.parameter_names:
+            del self.instrument.parameters[name]
+        for name in set(self.instrument.functions) - self.function_names:
+            del self.instrument.functions[name]
 
     def test_validate_function(self):
         instrument = self.instrument
@@ -41,7 +66,10 @@ class TestInstrument(TestCase):
 
 
     def test_attr_access(self):
-        instrument = self.instrument
+        # Use a separate instrument, since it is closed during the test
+        instrument = DummyInstrument(name='testdummy_closed', gates=self.gates)
+        # Closing twice is harmless, so this also covers early failures
+        self.addCleanup(instrument.close)
 
         # test the instrument works
         instrument.dac1.set(10)
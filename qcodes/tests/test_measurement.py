@@ -1,4 +1,4 @@
-from time import sleep
+from time import sleep, perf_counter
 import numpy as np
 from unittest import TestCase
 from functools import partial
@@ -7,6 +7,7 @@ import logging
 from qcodes.config.config import DotDict
 from qcodes import Loop, Parameter, load_data, ParameterNode, new_job, MultiParameter
 from qcodes.measurement import Measurement, Sweep, running_measurement
+from qcodes.tests.common import ListHandler
 
 
 def verify_msmt(msmt, verification_arrays=None, allow_nan=False):
@@ -100,6 +101,22 @@ class TestNewLoopBasics(TestCase):
         data = load_data(msmt.dataset.location)
         self.assertEqual(data.metadata.get("measurement_type"), "Measurement")
 
+    def test_new_loop_1D_reverse(self):
+        sweep_vals = []
+        with Measurement("new_loop_1D_reverse") as msmt:
+            for val in Sweep(self.p_sweep.sweep(0, 1, 0.1), reverse=True):
+                self.assertEqual(self.p_sweep(), val)
+                sweep_vals.append(val)
+                msmt.measure(self.p_measure)
+
+        np.testing.assert_array_almost_equal(sweep_vals, np.linspace(1, 0, 11))
+        # Data is stored in reverse
+        set_array = msmt.set_arrays[(0,)]
+        np.testing.assert_array_almost_equal(set_array, np.linspace(0, 1, 11))
+        np.testing.assert_array_almost_equal(
+            msmt.data_arrays[(0, 0)], np.linspace(0, 10, 11)
+        )
+
     def test_new_loop_1D_double(self):
         arrs = {}
 
@@ -274,6 +291,22 @@ class TestNewLoopBasics(TestCase):
         self.assertEqual(data.measurable_0_0.label, "MyLabel")
         self.assertEqual(data.measurable_0_0.unit, "Hz")
 
+    def test_measure_timestamp(self):
+        with Measurement("measure_timestamp") as msmt:
+            for k, val in enumerate(Sweep(self.p_sweep.sweep(0, 1, 0.1))):
+                msmt.measure(self.p_measure, timestamp=True)
+
+        self.assertListEqual([(0, 0), (0, 2), (0, 3)], list(msmt.data_arrays))
+
+        data = load_data(msmt.dataset.location)
+        self.assertEqual(data.T_pre_0_0.unit, "s")
+        self.assertIn("p_measure_0_2", data.arrays)
+        self.assertEqual(data.T_post_0_3.unit, "s")
+        self.assertTrue(np.all(data.T_pre_0_0.ndarray <= data.T_post_0_3.ndarray))
+        self.assertTrue(np.all(np.diff(data.T_pre_0_0.ndarray) >= 0))
+
+        verify_msmt(msmt)
+
     def test_error_when_array_limit_reached(self):
         with Measurement('error_when_array_limit_reached') as msmt:
             for k in range(msmt.max_arrays+1):  # Note the lack of an encapsulating Sweep
@@ -679,9 +712,19 @@ class TestMeasurementThread(TestCase):
             for k in Sweep([1, 2, 3, 4], name="sweep_vals"):
                 msmt.measure(123, "test_val")
 
+    def wait_until_paused(self, timeout=1):
+        """Wait until the measurement thread is paused inside its Sweep"""
+        t0 = perf_counter()
+        while perf_counter() - t0 < timeout:
+            msmt = running_measurement()
+            if msmt is not None and msmt.is_paused and msmt.loop_indices:
+                return msmt
+            sleep(0.001)
+        raise TimeoutError("Measurement thread did not pause")
+
     def test_double_thread_measurement(self):
         job = new_job(self.create_measurement)
-        sleep(0.2)
+        self.wait_until_paused()
         with self.assertRaises(RuntimeError):
             with Measurement("new_measurement") as msmt:
                 self.assertEqual(0, 1, 'Concurrent measurement test failed incorrectly.')
@@ -691,7 +734,7 @@ class TestMeasurementThread(TestCase):
 
     def test_double_thread_measure(self):
         job = new_job(self.create_measurement)
-        sleep(0.2)
+        self.wait_until_paused()
         msmt = Measurement("new_measurement")
         with self.assertRaises(RuntimeError):
             msmt.measure(123, "test_val")
@@ -701,12 +744,47 @@ class TestMeasurementThread(TestCase):
 
     def test_double_thread_sweep(self):
         job = new_job(self.create_measurement)
-        sleep(0.2)
+        self.wait_until_paused()
         Sweep([1, 2, 3], "sweep_parameter")
 
         running_measurement().resume()
         job.join()
 
+    def test_pause_resume(self):
+        job = new_job(self.create_measurement)
+        msmt = self.wait_until_paused()
+        self.assertTrue(msmt.is_paused)
+        self.assertEqual(msmt.loop_indices, (0,))
+
+        msmt.resume()
+        self.assertFalse(msmt.is_paused)
+        job.join()
+        self.assertFalse(job.is_alive())
+        self.assertEqual(msmt.data_arrays[(0, 0)].ndarray.tolist(), [123] * 4)
+
+    def test_stop_paused(self):
+        job = new_job(self.create_measurement)
+        msmt = self.wait_until_paused()
+        # Ensure the thread cannot stay paused forever if stop fails
+        self.addCleanup(msmt._run_event.set)
+
+        msmt.stop()
+        job.join(timeout=1)
+        self.assertFalse(job.is_alive())
+        self.assertIsNone(running_measurement())
+
+    def test_terminate_paused(self):
+        job = new_job(self.create_measurement)
+        msmt = self.wait_until_paused()
+        # Ensure the thread cannot stay paused forever if terminate fails
+        self.addCleanup(msmt._run_event.set)
+
+        job.terminate()
+        job.join(timeout=1)
+        self.assertFalse(job.is_alive())
+        self.assertTrue(msmt.is_paused)
+        self.assertIsNone(running_measurement())
+
 
 class MultiParameterTest(MultiParameter):
     def __init__(self, name):
@@ -1290,26 +1368,12 @@ class TestMeasurementControl(TestCase):
         verify_msmt(msmt, verification_arrays=verification_arrays, allow_nan=True)
 
 
-class ListHandler(logging.Handler):  # Inherit from logging.Handler
-    def __init__(self, log_list):
-        # run the regular Handler __init__
-        logging.Handler.__init__(self)
-        self.setLevel(logging.DEBUG)
-        # Our custom argument
-        self.log_list = log_list
-
-    def emit(self, record):
-        # record.message is the log message
-        self.log_list.append(record.msg)
-
-
 class TestMeasurementFail(TestCase):
     def setUp(self):
         logging.basicConfig(level=logging.DEBUG, format='%(message)s')
         logger = logging.getLogger()
         logger.level = logging.DEBUG
-        self.log_list = []
-        self.handler = ListHandler(self.log_list)
+        self.handler = ListHandler()
         logging.getLogger().addHandler(self.handler)
 
     def tearDown(self):
@@ -1324,7 +1388,8 @@ class TestMeasurementFail(TestCase):
             with Measurement('measurement_fail') as msmt:
                 raise RuntimeError('help')
 
-        self.assertTrue(any('Measurement error RuntimeError(help)' in msg for msg in self.log_list))
+        self.assertTrue(any('Measurement error RuntimeError(help)' in record.getMessage()
+                            for record in self.handler.records))
 
     def test_measurement_except_final_actions(self):
         p_except = Parameter(initial_value=42, set_cmd=None)
@@ -20,6 +20,7 @@ from qcodes.instrument.parameter import (
     InstrumentRefParameter)
 import qcodes.utils.validators as vals
 from qcodes.tests.instrument_mocks import DummyInstrument
+from qcodes.tests.common import ListHandler
 
 
 class GettableParam(Parameter):
@@ -656,22 +657,21 @@ class TestMultiParameter(TestCase):
         names = ['0D', '1D', '2D']
         shapes = ((), (3,), (2, 2))
 
-        # three cases where only name gets used for full_name
-        for instrument in blank_instruments:
-            p = SimpleMultiParam([0, [1, 2, 3], [[4, 5], [6, 7]]],
-                                 name, names, shapes)
-            p._instrument = instrument
-            self.assertEqual(str(p), name)
-
-            self.assertEqual(p.full_names, names)
-
-        # and finally an instrument that really has a name
-        p = SimpleMultiParam([0, [1, 2, 3], [[4, 5], [6, 7]]],
-                             name, names, shapes)
-        p._instrument = named_instrument
-        self.assertEqual(str(p), 'astro_mixed_dimensions')
-
-        self.assertEqual(p.full_names, ['astro_0D', 'astro_1D', 'astro_2D'])
+        # (instrument, expected str, expected full_names): three cases where
+        # only name gets used for full_name, and finally an instrument that
+        # really has a name
+        cases = [(instrument, name, names)
+                 for instrument in blank_instruments]
+        cases.append((named_instrument, 'astro_mixed_dimensions',
+                      ['astro_0D', 'astro_1D', 'astro_2D']))
+
+        for instrument, expected_str, expected_full_names in cases:
+            with self.subTest(instrument=instrument):
+                p = SimpleMultiParam([0, [1, 2, 3], [[4, 5], [6, 7]]],
+                                     name, names, shapes)
+                p._instrument = instrument
+                self.assertEqual(str(p), expected_str)
+                self.assertEqual(p.full_names, expected_full_names)
 
     def test_constructor_errors(self):
         bad_constructors = [
@@ -796,15 +796,30 @@ class TestStandardParam(TestCase):
         self.assertEqual(p(), 'on')
 
 
+# Instrument holding the parameters added by tests, shared between test
+# classes of this module. Created in setUpModule
+_dummy_holder = None
+
+
+def setUpModule():
+    global _dummy_holder
+    _dummy_holder = DummyInstrument('dummy_holder')
+
+
+def tearDownModule():
+    global _dummy_holder
+    _dummy_holder.close()
+    _dummy_holder = None
+
+
 class TestManualParameterValMapping(TestCase):
     def setUp(self):
-        self.instrument = DummyInstrument('dummy_holder')
+        self.instrument = _dummy_holder
 
     def tearDown(self):
-        self.instrument.close()
+        self.instrument.parameters.pop('myparameter', None)
         del self.instrument
 
-
     def test_val_mapping(self):
         self.instrument.add_parameter('myparameter', set_cmd=None, get_cmd=None, val_mapping={'A': 0, 'B': 1})
         self.instrument.myparameter('A')
@@ -816,7 +831,7 @@ class TestManualParameterValMapping(TestCase):
 class TestInstrumentRefParameter(TestCase):
 
     def setUp(self):
-        self.a = DummyInstrument('dummy_holder')
+        self.a = _dummy_holder
         self.d = DummyInstrument('dummy')
 
     def test_get_instr(self):
@@ -828,7 +843,7 @@ class TestInstrumentRefParameter(TestCase):
         self.assertEqual(self.a.test.get_instr(), self.d)
 
     def tearDown(self):
-        self.a.close()
+        self.a.parameters.pop('test', None)
         self.d.close()
         del self.a
         del self.d
@@ -1356,26 +1371,12 @@ class TestCopyParameterCount(TestCase):
             self.assertListEqual([p1, p2, p1], self.deepcopy_list)
 
 
-class ListHandler(logging.Handler):  # Inherit from logging.Handler
-    def __init__(self, log_list):
-        # run the regular Handler __init__
-        logging.Handler.__init__(self)
-        self.setLevel(logging.DEBUG)
-        # Our custom argument
-        self.log_list = log_list
-
-    def emit(self, record):
-        # record.message is the log message
-        self.log_list.append(record.msg)
-
-
 class TestParameterLogging(TestCase):
     def setUp(self):
         logging.basicConfig(level=logging.DEBUG, format='%(message)s')
         logger = logging.getLogger()
         logger.level = logging.DEBUG
-        self.log_list = []
-        self.handler = ListHandler(self.log_list)
+        self.handler = ListHandler()
         logging.getLogger().addHandler(self.handler)
         print('Started logging')
 
@@ -1385,21 +1386,21 @@ class TestParameterLogging(TestCase):
 
     def test_logging(self):
         p = Parameter('p', initial_value=41, set_cmd=None)
-        self.assertEqual(len(self.log_list), 1)
+        self.assertEqual(len(self.handler.records), 1)
         p(42)
-        self.assertEqual(len(self.log_list), 2)
+        self.assertEqual(len(self.handler.records), 2)
 
         p.log_changes = False
         p(43)
-        self.assertEqual(len(self.log_list), 2)
+        self.assertEqual(len(self.handler.records), 2)
 
         p.log_changes = True
         p(44)
-        self.assertEqual(len(self.log_list), 3)
+        self.assertEqual(len(self.handler.records), 3)
 
         # Set to same value, no log should be emitted
         p(44)
-        self.assertEqual(len(self.log_list), 3)
+        self.assertEqual(len(self.handler.records), 3)
 
 
 class TestParameterSnapshotting(TestCase):
@@ -15,31 +15,25 @@ class TestSweepValues(TestCase):
     def test_errors(self):
         c0 = self.c0
 
-        # only complete 3-part slices are valid
-        with self.assertRaises(TypeError):
-            c0[1:2]  # For Int params this could be defined as step=1
-        with self.assertRaises(TypeError):
-            c0[:2:3]
-        with self.assertRaises(TypeError):
-            c0[1::3]
-        with self.assertRaises(TypeError):
-            c0[:]  # For Enum params we *could* define this one too...
-
-        # fails if the parameter has no setter
-        with self.assertRaises(TypeError):
-            self.getter[0:0.1:0.01]
-
-        # validates every step value against the parameter's Validator
-        with self.assertRaises(ValueError):
-            c0[5:15:1]
-        with self.assertRaises(ValueError):
-            c0[5.0:15.0:1.0]
-        with self.assertRaises(ValueError):
-            c0[-12]
-        with self.assertRaises(ValueError):
-            c0[-5, 12, 5]
-        with self.assertRaises(ValueError):
-            c0[-5, 12:8:1, 5]
+        bad_sweeps = [
+            # only complete 3-part slices are valid
+            (TypeError, c0, slice(1, 2)),  # For Int params this could be step=1
+            (TypeError, c0, slice(None, 2, 3)),
+            (TypeError, c0, slice(1, None, 3)),
+            (TypeError, c0, slice(None)),  # For Enum params we *could* allow this
+            # fails if the parameter has no setter
+            (TypeError, self.getter, slice(0, 0.1, 0.01)),
+            # validates every step value against the parameter's Validator
+            (ValueError, c0, slice(5, 15, 1)),
+            (ValueError, c0, slice(5.0, 15.0, 1.0)),
+            (ValueError, c0, -12),
+            (ValueError, c0, (-5, 12, 5)),
+            (ValueError, c0, (-5, slice(12, 8, 1), 5))
+        ]
+        for error, parameter, keys in bad_sweeps:
+            with self.subTest(parameter=parameter.name, keys=keys):
+                with self.assertRaises(error):
+                    parameter[keys]
 
         # cannot combine SweepValues for different parameters
         with self.assertRaises(TypeError):
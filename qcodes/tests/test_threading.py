@@ -1,5 +1,3 @@
-import gc
-
 from unittest import TestCase
 
 from qcodes import Loop
@@ -22,8 +20,6 @@ class TestUnsafeThreading(TestCase):
         del self.inst1
         del self.inst2
 
-        gc.collect()
-
     def test_unsafe_exception(self):
         to_meas = (self.inst1.v1, self.inst1.v2)
         loop = Loop(self.inst2.v1.sweep(0, 1, num=10)).each(*to_meas)
@@ -1,3 +1,5 @@
+from string import Formatter
+
 from .deferred_operations import is_function
 
 
@@ -5,6 +7,34 @@ class NoCommandError(Exception):
     pass
 
 
+def _split_single_field(cmd):
+    """
+    Split a command string with exactly one plain replacement field, like
+    ``'VOLT {}'``, into the literal text before and after the field.
+
+    Returns None if the string has any other fields, a format spec or a
+    conversion, or cannot be parsed.
+    """
+    prefix, suffix, field_count = '', '', 0
+    try:
+        for literal, field, spec, conversion in Formatter().parse(cmd):
+            if field_count:
+                suffix += literal
+            else:
+                prefix += literal
+
+            if field is not None:
+                if field not in ('', '0') or spec or conversion:
+                    return None
+                field_count += 1
+    except ValueError:
+        return None
+
+    if field_count != 1:
+        return None
+    return prefix, suffix
+
+
 class Command:
     """
     Create a callable command from a string or function.
@@ -89,6 +119,15 @@ class Command:
                     ('multi', True): self.call_by_str_parsed_in2_out
                 }[(parse_input, parse_output)]
 
+                # A single plain field, as in most set commands, is filled in
+                # by joining strings instead of parsing cmd on every call
+                affixes = None
+                if arg_count == 1 and not (parse_input or parse_output):
+                    affixes = _split_single_field(cmd)
+                if affixes is not None:
+                    self._cmd_prefix, self._cmd_suffix = affixes
+                    self.exec_function = self.call_by_str_affixes
+
             elif exec_str is not None:
                 raise TypeError('exec_str must be a function with one arg,' +
                                 ' not {}'.format(repr(exec_str)))
@@ -125,6 +164,10 @@ class Command:
         """Execute a formatted string."""
         return self.exec_str(self.cmd_str.format(*args))
 
+    def call_by_str_affixes(self, arg):
+        """Execute a single-field string, joining the arg with its affixes."""
+        return self.exec_str(f'{self._cmd_prefix}{arg}{self._cmd_suffix}')
+
     def call_by_str_parsed_out(self, *args):
         """Execute a formatted string with output parsing."""
         return self.output_parser(self.exec_str(self.cmd_str.format(*args)))
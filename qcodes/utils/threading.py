@@ -144,15 +144,17 @@ def raise_exception_in_thread(
     assert thread.is_alive(), "thread must be started"
     for tid, tobj in threading._active.items():
         if tobj is thread:
+            # Thread ids are unsigned longs, which would otherwise be
+            # truncated to a C int by ctypes
             res = ctypes.pythonapi.PyThreadState_SetAsyncExc(
-                tid, ctypes.py_object(exception_type)
+                ctypes.c_ulong(tid), ctypes.py_object(exception_type)
             )
             if res == 0:
                 raise ValueError("nonexistent thread id")
             elif res > 1:
                 # """if it returns a number greater than one, you're in trouble,
                 # and you should call it again with exc=NULL to revert the effect"""
-                ctypes.pythonapi.PyThreadState_SetAsyncExc(tid, 0)
+                ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(tid), None)
                 raise SystemError("PyThreadState_SetAsyncExc failed")
             return
 
@@ -1,5 +1,6 @@
 """Helper for adding content stored in a file to a jupyter notebook."""
 import os
+from functools import lru_cache
 from pkg_resources import resource_string
 from IPython.display import display, Javascript, HTML
 
@@ -12,6 +13,12 @@ from IPython.display import display, Javascript, HTML
 # in an egg or zip file. See:
 # http://pythonhosted.org/setuptools/setuptools.html#accessing-data-files-at-runtime
 
+@lru_cache(maxsize=None)
+def _read_resource(qcodes_path):
+    """Read a qcodes package file. Widget assets are read from disk once."""
+    return resource_string('qcodes', qcodes_path).decode('utf-8')
+
+
 def display_auto(qcodes_path, file_type=None):
     """
     Display some javascript, css, or html content in a jupyter notebook.
@@ -27,7 +34,7 @@ def display_auto(qcodes_path, file_type=None):
             what type of file this is. Case insensitive, supported values
             are 'js', 'css', and 'html'
     """
-    contents = resource_string('qcodes', qcodes_path).decode('utf-8')
+    contents = _read_resource(qcodes_path)
 
     if file_type is None:
         ext = os.path.splitext(qcodes_path)[1].lower()
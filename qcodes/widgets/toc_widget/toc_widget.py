@@ -1,7 +1,8 @@
-from ipywidgets.widgets import *
-from traitlets import Unicode, List, Bool
+from ipywidgets.widgets import DOMWidget
+from traitlets import Unicode
 
 from qcodes.widgets import display_auto
+from qcodes.utils.helpers import using_ipython
 
 
 
@@ -14,5 +15,6 @@ class TOCWidget(DOMWidget):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        display_auto('widgets/toc_widget/main.css')
-        display_auto('widgets/toc_widget/toc_widget.js')
\ No newline at end of file
+        if using_ipython():
+            display_auto('widgets/toc_widget/main.css')
+            display_auto('widgets/toc_widget/toc_widget.js')